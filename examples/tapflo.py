@@ -1,127 +1,232 @@
-import json
 from datetime import datetime
+from types import SimpleNamespace
+
+# orjson parses typical WordPress payloads 2-3x faster than stdlib json;
+# fall back transparently when it isn't installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# The former Guid/RenderedData/Content/YoastHeadJson wrapper classes were
+# allocated once per Product only to expose dict keys as attributes.
+# SimpleNamespace (implemented in C) gives the same attribute API without a
+# custom __init__ frame per object.
+
+def _make_guid(data):
+    """Builds a 'guid' view exposing .rendered."""
+    ns = SimpleNamespace(rendered=None)
+    if data:
+        ns.__dict__.update(data)
+    return ns
+
+def _make_content(data):
+    """Builds a 'content' view exposing .rendered and .protected."""
+    ns = SimpleNamespace(rendered=None, protected=None)
+    if data:
+        ns.__dict__.update(data)
+    return ns
+
+def _make_yoast_head_json(data):
+    """Builds a 'yoast_head_json' view exposing the raw keys as attributes."""
+    return SimpleNamespace(**data) if data else SimpleNamespace()
+
+def _make_meta(data):
+    """Builds a Meta object, skipping the classmethod descriptor hop."""
+    return Meta(data or {})
 
-class Guid:
-    """Represents the 'guid' part of the JSON data."""
-    def __init__(self, rendered):
-        self.rendered = rendered
-
-    @classmethod
-    def from_dict(cls, data):
-        """Creates a Guid object from a dictionary."""
-        return cls(rendered=data.get('rendered'))
-
-class RenderedData:
-    """Represents any object with a 'rendered' key."""
-    def __init__(self, rendered):
-        self.rendered = rendered
-
-    @classmethod
-    def from_dict(cls, data):
-        """Creates a RenderedData object from a dictionary."""
-        return cls(rendered=data.get('rendered'))
-
-class Content(RenderedData):
-    """Represents the 'content' part of the JSON data."""
-    def __init__(self, rendered, protected):
-        super().__init__(rendered)
-        self.protected = protected
+class Meta:
+    """Represents the 'meta' part of the JSON data.
 
-    @classmethod
-    def from_dict(cls, data):
-        """Creates a Content object from a dictionary."""
-        return cls(
-            rendered=data.get('rendered'),
-            protected=data.get('protected')
-        )
+    Meta keys are site-specific, so the dict is stored wholesale and
+    proxied through ``__getattr__`` rather than enumerated in ``__slots__``.
+    """
+    __slots__ = ('_data',)
 
-class Meta:
-    """Represents the 'meta' part of the JSON data."""
     def __init__(self, data):
-        # Initializes all meta properties from the provided dictionary
-        for key, value in data.items():
-            setattr(self, key, value)
+        self._data = data
+
+    def __getattr__(self, key):
+        # Never resolve the backing slot or dunder names through the data
+        # dict: pickle probes attributes (e.g. __setstate__) on instances
+        # whose _data slot isn't set yet, and falling through to
+        # ``self._data`` there would recurse back into __getattr__.
+        if key == '_data' or (key.startswith('__') and key.endswith('__')):
+            raise AttributeError(key)
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(key) from None
 
     @classmethod
     def from_dict(cls, data):
         """Creates a Meta object from a dictionary."""
         return cls(data)
 
-class YoastHeadJson:
-    """Represents the 'yoast_head_json' part of the JSON data."""
-    def __init__(self, data):
-        # Initializes all yoast_head_json properties from the provided dictionary
-        self.title = data.get('title')
-        self.description = data.get('description')
-        self.robots = data.get('robots')
-        self.og_locale = data.get('og_locale')
-        self.og_type = data.get('og_type')
-        self.og_title = data.get('og_title')
-        self.og_description = data.get('og_description')
-        self.og_url = data.get('og_url')
-        self.og_site_name = data.get('og_site_name')
-        self.article_modified_time = data.get('article_modified_time')
-        self.og_image = data.get('og_image')
-        self.twitter_card = data.get('twitter_card')
-        self.twitter_misc = data.get('twitter_misc')
-        self.schema_data = data.get('schema')
-
-    @classmethod
-    def from_dict(cls, data):
-        """Creates a YoastHeadJson object from a dictionary."""
-        return cls(data)
+class _LazyField:
+    """Parse-on-first-access descriptor for a heavy Product field.
+
+    The converted value is stored in a backing slot on the instance; an
+    unset slot (AttributeError) marks the field as not yet computed, so no
+    sentinel object is needed.
+    """
+    __slots__ = ('key', 'convert', 'store')
+
+    def __init__(self, key, convert, store):
+        self.key = key
+        self.convert = convert
+        self.store = store  # member descriptor of the backing slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return self.store.__get__(obj, objtype)
+        except AttributeError:
+            value = self.convert(obj._raw.get(self.key))
+            self.store.__set__(obj, value)
+            return value
+
+    def __set__(self, obj, value):
+        self.store.__set__(obj, value)
+
+
+# Field tables driving the generated Product.__init__ below.  Keeping the
+# kebab-case JSON keys in module-level tuples means the strings are interned
+# once instead of re-evaluated per construction.
+_PRODUCT_DATETIME_FIELDS = ('date', 'date_gmt', 'modified', 'modified_gmt')
+
+# Fields parsed lazily on first access; most consumers never touch them.
+_PRODUCT_LAZY_FIELDS = _PRODUCT_DATETIME_FIELDS + (
+    'guid', 'content', 'meta', 'yoast_head_json',
+)
+
+_PRODUCT_SCALAR_FIELDS = (
+    ('slug', 'slug'),
+    ('status', 'status'),
+    ('type', 'type'),
+    ('link', 'link'),
+    ('featured_media', 'featured_media'),
+    ('template', 'template'),
+    ('yoast_head', 'yoast_head'),
+    ('links', '_links'),
+)
+
+_PRODUCT_LIST_FIELDS = (
+    ('certyfikat', 'certyfikat'),
+    ('maks_cisnienie', 'maks-cisnienie'),
+    ('maks_temperatura', 'maks-temperatura'),
+    ('maks_wydajnosc', 'maks-wydajnosc'),
+    ('material', 'material'),
+    ('producentmarka', 'producentmarka'),
+    ('sektor_przemyslu', 'sektor-przemyslu'),
+    ('tapflo_solutions', 'tapflo-solutions'),
+    ('typ_urzadzenia', 'typ-urzadzenia'),
+    ('class_list', 'class_list'),
+)
 
 
 class Product:
-    """Represents the entire product JSON structure."""
-
-    def __init__(self, data):
-        """
-        Initializes the Product object from a dictionary.
+    """Represents the entire product JSON structure.
+
+    The ``__init__`` is generated once at import time from the field tables
+    above, so constructing a Product is a straight run of local-variable
+    stores instead of a wall of hand-written ``data.get`` calls.
+
+    The raw response dict is kept on ``_raw``; datetimes and the nested
+    wrapper objects are only parsed when first accessed, since typical
+    list-ingestion code reads just a handful of scalar fields.
+    """
+
+    __slots__ = (
+        ('_raw', 'id', 'title', 'acf')
+        + tuple('_' + attr for attr in _PRODUCT_LAZY_FIELDS)
+        + tuple(attr for attr, _ in _PRODUCT_SCALAR_FIELDS)
+        + tuple(attr for attr, _ in _PRODUCT_LIST_FIELDS)
+    )
+
+    # (attribute, JSON key) table for the taxonomy list fields; also the
+    # single place to extend when the site registers a new taxonomy.
+    _LIST_KEYS = _PRODUCT_LIST_FIELDS
+
+    @staticmethod
+    def _to_datetime(date_string, _datetime=datetime):
+        """Converts a WordPress date string to a datetime object.
+
+        WordPress emits a fixed 'YYYY-MM-DDTHH:MM:SS' format, so the fields
+        are sliced out directly instead of going through the general ISO 8601
+        dispatch in ``datetime.fromisoformat``, which is used only as a
+        fallback for unexpected formats.
         """
-        self.id = data.get('id')
-        self.date = self._to_datetime(data.get('date'))
-        self.date_gmt = self._to_datetime(data.get('date_gmt'))
-        self.guid = Guid.from_dict(data.get('guid', {}))
-        self.modified = self._to_datetime(data.get('modified'))
-        self.modified_gmt = self._to_datetime(data.get('modified_gmt'))
-        self.slug = data.get('slug')
-        self.status = data.get('status')
-        self.type = data.get('type')
-        self.link = data.get('link')
-        # self.title = RenderedData.from_dict(data.get('title', {}))
-        self.title = data.get('title', {}).get('rendered', '')
-        self.content = Content.from_dict(data.get('content', {}))
-        self.featured_media = data.get('featured_media')
-        self.template = data.get('template')
-        self.meta = Meta.from_dict(data.get('meta', {}))
-        self.certyfikat = data.get('certyfikat', [])
-        self.maks_cisnienie = data.get('maks-cisnienie', [])
-        self.maks_temperatura = data.get('maks-temperatura', [])
-        self.maks_wydajnosc = data.get('maks-wydajnosc', [])
-        self.material = data.get('material', [])
-        self.producentmarka = data.get('producentmarka', [])
-        self.sektor_przemyslu = data.get('sektor-przemyslu', [])
-        self.tapflo_solutions = data.get('tapflo-solutions', [])
-        self.typ_urzadzenia = data.get('typ-urzadzenia', [])
-        self.class_list = data.get('class_list', [])
-        self.acf = data.get('acf', {})
-        self.yoast_head = data.get('yoast_head')
-        self.yoast_head_json = YoastHeadJson.from_dict(data.get('yoast_head_json', {}))
-        self.links = data.get('_links')
-
-    def _to_datetime(self, date_string):
-        """Converts an ISO 8601 string to a datetime object."""
-        if date_string:
-            return datetime.fromisoformat(date_string)
-        return None
+        if not date_string:
+            return None
+        if len(date_string) == 19:
+            try:
+                return _datetime(
+                    int(date_string[0:4]),
+                    int(date_string[5:7]),
+                    int(date_string[8:10]),
+                    int(date_string[11:13]),
+                    int(date_string[14:16]),
+                    int(date_string[17:19]),
+                )
+            except ValueError:
+                pass
+        return _datetime.fromisoformat(date_string)
 
     @classmethod
     def from_json(cls, json_string):
         """Creates a Product object from a JSON string."""
-        data = json.loads(json_string)
+        data = _json_loads(json_string)
         return cls(data)
 
     def __repr__(self):
-        return f"<Product(id={self.id}, title='{self.title.rendered}')>"
+        return f"<Product(id={self.id}, title='{self.title}')>"
+
+
+def _compile_product_init():
+    """Build a specialized ``Product.__init__`` from the field tables.
+
+    ``data.get`` is aliased to a local ``g`` so every field load is a
+    LOAD_FAST + CALL instead of a repeated method lookup on ``data``.
+    """
+    lines = [
+        "def __init__(self, data):",
+        "    self._raw = data",
+        "    g = data.get",
+        "    self.id = g('id')",
+        "    self.title = (g('title') or {}).get('rendered', '')",
+        "    self.acf = g('acf', {})",
+    ]
+    for attr, key in _PRODUCT_SCALAR_FIELDS:
+        lines.append(f"    self.{attr} = g({key!r})")
+    # The shared empty-tuple default is a folded constant, so absent
+    # taxonomy keys cost no allocation (the old [] default built a fresh
+    # list per field per Product).
+    for attr, key in Product._LIST_KEYS:
+        lines.append(f"    self.{attr} = g({key!r}, ())")
+
+    namespace = {}
+    exec(compile('\n'.join(lines), '<tapflo-product-init>', 'exec'), namespace)
+    init = namespace['__init__']
+    init.__doc__ = "Initializes the Product object from a dictionary."
+    return init
+
+
+def _install_lazy_fields():
+    """Attach the parse-on-first-access descriptors to Product."""
+    converters = {
+        'guid': _make_guid,
+        'content': _make_content,
+        'meta': _make_meta,
+        'yoast_head_json': _make_yoast_head_json,
+    }
+    for name in _PRODUCT_LAZY_FIELDS:
+        convert = converters.get(name, Product._to_datetime)
+        store = getattr(Product, '_' + name)
+        setattr(Product, name, _LazyField(name, convert, store))
+
+
+Product.__init__ = _compile_product_init()
+_install_lazy_fields()
 
@@ -68,6 +68,9 @@ setup(
             "sphinx-rtd-theme>=0.5.0",
             "sphinx-autodoc-typehints>=1.12.0",
         ],
+        "brotli": [
+            "brotli>=1.0.0",
+        ],
     },
     project_urls={
         "Bug Reports": "https://github.com/innerkorehq/wp-api-client/issues",
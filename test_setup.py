@@ -7,15 +7,21 @@ This is a simple test to ensure our setup.py works without errors.
 """
 
 import os
+import mmap
 import re
 
+# Precompiled bytes pattern: scanning the mmap'd file avoids decoding the
+# whole module just to pull out one line
+_VERSION_RE = re.compile(rb"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
+
 def get_version():
-    with open(os.path.join(os.path.dirname(__file__), "wp_api", "__init__.py"), encoding="utf-8") as f:
-        version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", f.read(), re.M)
-        if version_match:
-            return version_match.group(1)
-        else:
-            raise RuntimeError("Unable to find version string in wp_api/__init__.py")
+    with open(os.path.join(os.path.dirname(__file__), "wp_api", "__init__.py"), "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            version_match = _VERSION_RE.search(mapped)
+            if version_match:
+                return version_match.group(1).decode("utf-8")
+            else:
+                raise RuntimeError("Unable to find version string in wp_api/__init__.py")
 
 if __name__ == "__main__":
     try:
@@ -24,6 +30,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error extracting version: {e}")
         exit(1)
-    
+
     # Success
-    exit(0)
\ No newline at end of file
+    exit(0)
@@ -81,6 +81,45 @@ class TestWPClient(unittest.TestCase):
         self.assertEqual(result, {"id": 1, "title": "New Post"})
         mock_post.assert_called_once()
     
+    @mock.patch('requests.Session.request')
+    def test_get_with_headers(self, mock_request):
+        """Test GET request returning data and response headers."""
+        # Setup mock response
+        mock_response = mock.Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.status_code = 200
+        mock_response.json.return_value = [{"id": 1, "title": "Test Post"}]
+        mock_response.headers = {"X-WP-Total": "25", "X-WP-TotalPages": "3"}
+        mock_request.return_value = mock_response
+
+        # Call the method
+        data, headers = self.client.get_with_headers("posts", params={"page": 1})
+
+        # Assertions
+        self.assertEqual(data, [{"id": 1, "title": "Test Post"}])
+        self.assertEqual(headers["X-WP-TotalPages"], "3")
+        mock_request.assert_called_once()
+
+    @mock.patch('requests.Session.request')
+    def test_get_with_headers_not_modified(self, mock_request):
+        """Test that a 304 reply returns (None, headers) without parsing."""
+        # Setup mock response
+        mock_response = mock.Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.status_code = 304
+        mock_response.headers = {"ETag": '"abc123"'}
+        mock_request.return_value = mock_response
+
+        # Call the method with a conditional header
+        data, headers = self.client.get_with_headers(
+            "posts", headers={"If-None-Match": '"abc123"'}
+        )
+
+        # Assertions
+        self.assertIsNone(data)
+        self.assertEqual(headers["ETag"], '"abc123"')
+        mock_response.json.assert_not_called()
+
     def test_posts_property(self):
         """Test posts property."""
         posts = self.client.posts
@@ -0,0 +1,77 @@
+"""Tests for `wp_api` endpoint wrappers."""
+
+import unittest
+from unittest import mock
+
+from wp_api.endpoints.custom_fields import CustomFields
+
+
+class TestCustomFields(unittest.TestCase):
+    """Tests for the custom fields (post meta) endpoint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = mock.Mock()
+        self.meta = CustomFields(self.client, post_type="posts")
+
+    def test_get_many_maps_ids_to_meta(self):
+        """Test that get_many batches one request and maps id to meta."""
+        self.client.get.return_value = [
+            {"id": 1, "meta": {"color": "red"}},
+            {"id": 2, "meta": {"color": "blue"}},
+            {"id": 3},
+        ]
+
+        result = self.meta.get_many([1, 2, 3])
+
+        self.assertEqual(result, {
+            1: {"color": "red"},
+            2: {"color": "blue"},
+            3: {},
+        })
+        self.client.get.assert_called_once()
+        endpoint, params = self.client.get.call_args[0]
+        self.assertEqual(endpoint, "posts")
+        self.assertEqual(params["include"], "1,2,3")
+        self.assertEqual(params["_fields"], "id,meta")
+        self.assertEqual(params["per_page"], 3)
+
+    def test_get_many_chunks_large_id_lists(self):
+        """Test that more than 100 IDs are split across requests."""
+        def fake_get(endpoint, params):
+            ids = [int(i) for i in params["include"].split(",")]
+            return [{"id": i, "meta": {"n": i}} for i in ids]
+        self.client.get.side_effect = fake_get
+
+        post_ids = list(range(1, 151))
+        result = self.meta.get_many(post_ids)
+
+        self.assertEqual(len(result), 150)
+        self.assertEqual(result[150], {"n": 150})
+        self.assertEqual(self.client.get.call_count, 2)
+        first_params = self.client.get.call_args_list[0][0][1]
+        second_params = self.client.get.call_args_list[1][0][1]
+        self.assertEqual(first_params["per_page"], 100)
+        self.assertEqual(second_params["per_page"], 50)
+
+    def test_get_many_empty_ids(self):
+        """Test that get_many with no IDs skips the request."""
+        self.assertEqual(self.meta.get_many([]), {})
+        self.client.get.assert_not_called()
+
+    def test_get_many_extra_params(self):
+        """Test that extra query parameters are passed through."""
+        self.client.get.return_value = []
+        self.meta.get_many([5], context="edit")
+        _, params = self.client.get.call_args[0]
+        self.assertEqual(params["context"], "edit")
+
+    def test_get_many_wraps_errors(self):
+        """Test that request failures surface as ValueError."""
+        self.client.get.side_effect = RuntimeError("boom")
+        with self.assertRaises(ValueError):
+            self.meta.get_many([1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for `wp_api` exceptions module."""
+
+import unittest
+from unittest import mock
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from wp_api.exceptions import WPAPIRateLimitError, WPAPIRequestError
+
+
+class TestWPAPIRateLimitError(unittest.TestCase):
+    """Tests for Retry-After parsing on rate limit errors."""
+
+    def _response(self, headers):
+        """Build a mock response carrying the given headers."""
+        response = mock.Mock()
+        response.headers = headers
+        response.json.return_value = {}
+        return response
+
+    def test_retry_after_delta_seconds(self):
+        """Test the delta-seconds form of Retry-After."""
+        error = WPAPIRateLimitError(
+            "Rate limited", status_code=429,
+            response=self._response({"Retry-After": "120"})
+        )
+        self.assertEqual(error.retry_after, 120)
+
+    def test_retry_after_http_date(self):
+        """Test the HTTP-date form of Retry-After."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+        error = WPAPIRateLimitError(
+            "Rate limited", status_code=429,
+            response=self._response(
+                {"Retry-After": format_datetime(retry_at, usegmt=True)}
+            )
+        )
+        self.assertIsNotNone(error.retry_after)
+        # Allow for the seconds spent between header creation and parsing
+        self.assertGreaterEqual(error.retry_after, 85)
+        self.assertLessEqual(error.retry_after, 90)
+
+    def test_retry_after_http_date_in_past(self):
+        """Test that an HTTP-date in the past clamps to zero."""
+        retry_at = datetime.now(timezone.utc) - timedelta(seconds=60)
+        error = WPAPIRateLimitError(
+            "Rate limited", status_code=429,
+            response=self._response(
+                {"Retry-After": format_datetime(retry_at, usegmt=True)}
+            )
+        )
+        self.assertEqual(error.retry_after, 0)
+
+    def test_retry_after_missing_header(self):
+        """Test that a missing Retry-After header yields None."""
+        error = WPAPIRateLimitError(
+            "Rate limited", status_code=429, response=self._response({})
+        )
+        self.assertIsNone(error.retry_after)
+
+    def test_retry_after_unparseable_value(self):
+        """Test that an unparseable Retry-After value yields None."""
+        error = WPAPIRateLimitError(
+            "Rate limited", status_code=429,
+            response=self._response({"Retry-After": "soon"})
+        )
+        self.assertIsNone(error.retry_after)
+
+    def test_retry_after_without_response(self):
+        """Test that a missing response yields None."""
+        error = WPAPIRateLimitError("Rate limited", status_code=429)
+        self.assertIsNone(error.retry_after)
+
+    def test_is_request_error(self):
+        """Test that rate limit errors stay in the request error hierarchy."""
+        error = WPAPIRateLimitError("Rate limited", status_code=429)
+        self.assertIsInstance(error, WPAPIRequestError)
+        self.assertEqual(error.status_code, 429)
+
+
+if __name__ == '__main__':
+    unittest.main()
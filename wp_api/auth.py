@@ -31,17 +31,19 @@ class BasicAuth:
         """
         self.username = username
         self.password = password
-    
+        # Precompute the header value once; authenticating a session is
+        # then a single dict assignment
+        auth_string = f"{username}:{password}"
+        self._auth_header = "Basic " + base64.b64encode(auth_string.encode()).decode()
+
     def authenticate(self, session: requests.Session) -> None:
         """
         Add authentication to session
-        
+
         Args:
             session (requests.Session): The session to authenticate
         """
-        auth_string = f"{self.username}:{self.password}"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        session.headers.update({"Authorization": f"Basic {encoded_auth}"})
+        session.headers.update({"Authorization": self._auth_header})
 
 
 class ApplicationPasswordAuth:
@@ -61,17 +63,19 @@ class ApplicationPasswordAuth:
         """
         self.username = username
         self.app_password = app_password
-    
+        # Precompute the header value once; authenticating a session is
+        # then a single dict assignment
+        auth_string = f"{username}:{app_password}"
+        self._auth_header = "Basic " + base64.b64encode(auth_string.encode()).decode()
+
     def authenticate(self, session: requests.Session) -> None:
         """
         Add authentication to session
-        
+
         Args:
             session (requests.Session): The session to authenticate
         """
-        auth_string = f"{self.username}:{self.app_password}"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        session.headers.update({"Authorization": f"Basic {encoded_auth}"})
+        session.headers.update({"Authorization": self._auth_header})
 
 
 class OAuth1:
@@ -38,11 +38,13 @@ class WPClient:
         user_agent: str = "Python WordPress REST API Client",
         verify_ssl: bool = False,
         retry_count: int = 0,
-        retry_backoff_factor: float = 0.1
+        retry_backoff_factor: float = 0.1,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10
     ):
         """
         Initialize the WordPress REST API client
-        
+
         Args:
             base_url (str): The base URL of the WordPress site (e.g., https://example.com)
             auth: Authentication method (BasicAuth, OAuth1, or ApplicationPasswordAuth)
@@ -51,6 +53,8 @@ class WPClient:
             verify_ssl (bool): Whether to verify SSL certificates
             retry_count (int): Number of retries for failed requests
             retry_backoff_factor (float): Backoff factor for retries
+            pool_connections (int): Number of connection pools to cache
+            pool_maxsize (int): Maximum keep-alive connections per pool
         """
         if not base_url.endswith('/'):
             base_url += '/'
@@ -69,7 +73,16 @@ class WPClient:
             'Accept': 'application/json',
         })
         self.session.verify = verify_ssl
-        
+
+        # Keep-alive connection pooling so sequential and concurrent calls
+        # reuse TCP+TLS connections instead of re-handshaking per request
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Cache for discovered endpoints
         self._endpoints_cache = None
         
@@ -95,7 +108,29 @@ class WPClient:
             Response data (dict or list)
         """
         return self._request("GET", endpoint, params=params)
-    
+
+    def get_with_headers(self, endpoint: str, params: Optional[Dict] = None,
+                         headers: Optional[Dict] = None):
+        """
+        Make a GET request and return both the data and the response headers
+
+        WordPress list endpoints report collection size via the X-WP-Total
+        and X-WP-TotalPages response headers; this variant exposes them.
+        Conditional request headers (If-None-Match / If-Modified-Since) may
+        be supplied; a 304 Not Modified reply returns None as the data.
+
+        Args:
+            endpoint (str): API endpoint (relative to base URL)
+            params (dict, optional): URL parameters to include
+            headers (dict, optional): Extra headers for this request only
+
+        Returns:
+            Tuple of (response data, response headers); the data is None
+            when the server answers 304 Not Modified
+        """
+        return self._request("GET", endpoint, params=params, headers=headers,
+                             with_headers=True)
+
     def post(self, endpoint: str, data: Dict, params: Optional[Dict] = None) -> Dict:
         """
         Make a POST request to the API
@@ -141,20 +176,25 @@ class WPClient:
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict] = None, 
-        params: Optional[Dict] = None
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        with_headers: bool = False
     ) -> Union[Dict, List]:
         """
         Make a request to the API
-        
+
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE)
             endpoint (str): API endpoint (relative to base URL)
             data (dict, optional): Data to send in the request body
             params (dict, optional): URL parameters to include
-            
+            headers (dict, optional): Extra headers for this request only
+            with_headers (bool): Also return the response headers
+
         Returns:
-            Response data (dict or list)
+            Response data (dict or list), or a (data, headers) tuple when
+            with_headers is True
         """
         url = urljoin(self.base_url, endpoint)
         request_kwargs = {
@@ -162,6 +202,9 @@ class WPClient:
             "timeout": self.timeout,
         }
         
+        if headers:
+            request_kwargs["headers"] = headers
+        
         if data is not None:
             request_kwargs["data"] = json.dumps(data)
             
@@ -172,6 +215,10 @@ class WPClient:
             try:
                 response = self.session.request(method, url, **request_kwargs)
                 response.raise_for_status()
+                if with_headers:
+                    if response.status_code == 304:
+                        return None, response.headers
+                    return response.json(), response.headers
                 return response.json()
                 
             except requests.exceptions.HTTPError as e:
@@ -257,13 +304,21 @@ class WPClient:
         else:
             raise WPAPIRequestError(error_msg, status_code=status_code, response=response) from error
     
-    def discover_endpoints(self) -> Dict:
+    def discover_endpoints(self, refresh: bool = False) -> Dict:
         """
         Discover available endpoints from the WordPress REST API
         
+        The response is cached for the lifetime of the client; pass
+        refresh=True to force a new discovery round-trip.
+        
+        Args:
+            refresh (bool): Bypass the cached discovery payload
+        
         Returns:
             Dictionary of available routes/endpoints
         """
+        if refresh:
+            self._endpoints_cache = None
         if self._endpoints_cache is None:
             try:
                 response = self.session.get(self.root_url, timeout=self.timeout)
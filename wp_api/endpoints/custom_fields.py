@@ -39,6 +39,43 @@ class CustomFields(BaseEndpoint):
         except Exception as e:
             raise ValueError(f"Failed to retrieve meta for {self.post_type} ID {post_id}: {str(e)}") from e
     
+    def get_many(self, post_ids: List[int], **params) -> Dict[int, Dict]:
+        """
+        Get all custom fields (meta) for several posts in batched requests
+
+        Issues one list request per 100 IDs (the WordPress per_page cap)
+        with `include` and `_fields=id,meta` instead of one request per
+        post, avoiding the N+1 round-trip pattern.
+
+        Args:
+            post_ids: List of post IDs
+            **params: Query parameters to include in the request
+
+        Returns:
+            Dictionary mapping post ID to its meta data
+        """
+        try:
+            if not post_ids:
+                return {}
+            meta_by_id = {}
+            # WordPress rejects per_page above 100 with rest_invalid_param
+            for start in range(0, len(post_ids), 100):
+                chunk = post_ids[start:start + 100]
+                request_params = {
+                    "include": ",".join(map(str, chunk)),
+                    "_fields": "id,meta",
+                    "per_page": len(chunk),
+                }
+                request_params.update(params)
+                posts = self.client.get(self.endpoint, request_params)
+                for post in posts:
+                    meta_by_id[post["id"]] = post.get("meta", {})
+            return meta_by_id
+        except Exception as e:
+            raise ValueError(
+                f"Failed to retrieve meta for {self.post_type} IDs {post_ids}: {str(e)}"
+            ) from e
+
     def get(self, post_id: int, meta_key: str, **params) -> Any:
         """
         Get a specific custom field (meta) for a post
@@ -2,9 +2,17 @@
 Custom Post Types support for the WordPress REST API
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Union
+from urllib.parse import urljoin
 from .base import BaseEndpoint
 
+# ijson enables incremental parsing of list responses (optional dependency)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 class CustomPostType(BaseEndpoint):
     """WordPress Custom Post Type API wrapper"""
@@ -101,6 +109,39 @@ class CustomPostType(BaseEndpoint):
         except Exception as e:
             raise ValueError(f"Failed to list {self.post_type} items: {str(e)}") from e
     
+    def iter_list(self, **params) -> Iterator[Dict]:
+        """
+        Stream custom post type items one at a time
+
+        When ijson is installed the response body is parsed incrementally,
+        so the full item list is never materialized in memory at once -
+        useful for large per_page values. Without ijson this falls back to
+        parsing the complete response.
+
+        Args:
+            **params: Query parameters to include in the request
+
+        Yields:
+            Custom post type items
+        """
+        url = urljoin(self.client.base_url, self.endpoint)
+        try:
+            response = self.client.session.get(
+                url, params=params, stream=True, timeout=self.client.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            raise ValueError(f"Failed to list {self.post_type} items: {str(e)}") from e
+
+        if IJSON_AVAILABLE:
+            # Let urllib3 decode gzip/deflate before ijson sees the bytes.
+            # use_float matches list(): plain floats instead of ijson's
+            # Decimal default for non-integer numbers
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'item', use_float=True)
+        else:
+            yield from response.json()
+
     def get(self, id: int, **params) -> Dict:
         """
         Get a single custom post type item by ID
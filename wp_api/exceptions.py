@@ -2,6 +2,10 @@
 Exceptions for WordPress REST API client
 """
 
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
 class WPAPIError(Exception):
     """Base class for WordPress REST API errors"""
     pass
@@ -31,7 +35,30 @@ class WPAPIRequestError(WPAPIError):
 
 class WPAPIRateLimitError(WPAPIRequestError):
     """Rate limiting error from the WordPress REST API"""
-    pass
+    
+    def __init__(self, message, status_code=None, response=None):
+        super().__init__(message, status_code=status_code, response=response)
+        # Seconds the server asked us to wait before retrying, taken from
+        # the Retry-After header. Both forms from RFC 7231 are accepted:
+        # delta-seconds and an HTTP-date (converted to seconds from now).
+        # None when the header is absent or unparseable.
+        self.retry_after = None
+        try:
+            value = response.headers.get('Retry-After')
+        except AttributeError:
+            value = None
+        if value is not None:
+            try:
+                self.retry_after = max(0, int(value))
+            except (TypeError, ValueError):
+                try:
+                    retry_at = parsedate_to_datetime(value)
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    delta = retry_at - datetime.now(timezone.utc)
+                    self.retry_after = max(0, int(delta.total_seconds()))
+                except (TypeError, ValueError):
+                    pass
 
 
 class WPAPINotFoundError(WPAPIRequestError):